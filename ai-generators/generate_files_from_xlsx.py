@@ -1,9 +1,22 @@
 import os
 import json
 import yaml
-import pandas as pd
+import openpyxl
 import argparse
-from datetime import datetime
+from collections import namedtuple
+from openpyxl.cell.cell import ERROR_CODES
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+try:
+    import orjson  # optional: much faster JSON encoder
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml-backed
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
 # ===== CONFIG =====
 DEFAULT_DATA_FILE = "templates/client-data.xlsx"
@@ -25,83 +38,170 @@ SHEET_TO_FOLDER = {
 }
 # ===================
 
+# Output locations per tab, with the paths joined once at import
+SheetSpec = namedtuple("SheetSpec", "name out_dir base_path")
+
+def make_sheet_spec(sheet_name, folder_name):
+    out_dir = os.path.join(OUTPUT_DIR, folder_name)
+    return SheetSpec(sheet_name, out_dir, os.path.join(out_dir, "main-data"))
+
+SHEET_SPECS = {name: make_sheet_spec(name, folder) for name, folder in SHEET_TO_FOLDER.items()}
+
+def get_sheet_spec(sheet_name):
+    """Configured spec for a tab, or one derived from its name"""
+    spec = SHEET_SPECS.get(sheet_name)
+    if spec is None:
+        spec = make_sheet_spec(sheet_name, sheet_name.lower().replace(" ", "-"))
+    return spec
+
+# Cell types that are already JSON/YAML-safe (float excluded: may be NaN)
+PLAIN_TYPES = frozenset({str, int, bool})
+DATETIME_TYPES = (datetime, date, time)
+# Cached formula errors ("#N/A", "#DIV/0!", ...) come back as plain strings;
+# pandas read them as NaN, so they are published as null, not as text
+EXCEL_ERRORS = frozenset(ERROR_CODES)
+
 def ensure_output_dir():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def sanitize_value(val):
     """Convert any non-JSON-safe value into string or None"""
-    if pd.isna(val):  # Covers NaN, NaT, None
-        return None
-    elif isinstance(val, (pd.Timestamp, datetime)):
-        return val.isoformat()
-    elif isinstance(val, pd.Timedelta):
-        return str(val)
-    elif hasattr(val, 'to_pydatetime'):  # Some pandas datetime types
-        return val.to_pydatetime().isoformat()
+    if type(val) in PLAIN_TYPES:  # Most cells: nothing to convert
+        return val
     elif isinstance(val, (list, dict)):
         # Recursively sanitize nested structures (unlikely in your data, but safe)
         if isinstance(val, list):
             return [sanitize_value(x) for x in val]
         else:
             return {k: sanitize_value(v) for k, v in val.items()}
+    elif val is None or (isinstance(val, float) and val != val):  # None / NaN
+        return None
+    elif isinstance(val, DATETIME_TYPES):
+        return val.isoformat()
+    elif isinstance(val, timedelta):
+        return str(val)
     else:
         # Fallback: convert everything else to string if needed later
         return val
 
-def save_json(data, path):
-    if not data:
+def save_json(clean_data, path):
+    """Write already-sanitized data; the target folder must exist"""
+    if not clean_data:
         print(f"⚠️ No data to save for {path}")
         return
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    
-    # Deep sanitize every value
-    clean_data = {k: sanitize_value(v) for k, v in data.items()}
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(clean_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(
+            clean_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(clean_data, f, indent=2, ensure_ascii=False)
     print(f"✅ SAVED: {path}")
 
-def save_yaml(data, path):
-    if not data:
+def save_yaml(clean_data, path):
+    """Write already-sanitized data; the target folder must exist"""
+    if not clean_data:
         return
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    
-    # Sanitize for YAML too (though YAML is more forgiving)
-    clean_data = {k: sanitize_value(v) for k, v in data.items()}
 
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(clean_data, f, allow_unicode=True)
+        yaml.dump(clean_data, f, allow_unicode=True, Dumper=YamlDumper)
     print(f"✅ SAVED: {path}")
 
-def process_sheet_to_file(sheet_name, df_sheet):
-    """Process one sheet → save as main-data.json/.yaml in mapped folder"""
-    if df_sheet.empty:
-        print(f"⚠️ Sheet '{sheet_name}' is empty — skipping")
-        return
-
-    # Take first row only → convert to clean dict
-    row_dict = df_sheet.iloc[0].to_dict()
-
-    # Get target folder name
-    folder_name = SHEET_TO_FOLDER.get(sheet_name, sheet_name.lower().replace(" ", "-"))
-    target_dir = os.path.join(OUTPUT_DIR, folder_name)
-    base_path = os.path.join(target_dir, "main-data")
+def sheet_rows(ws):
+    """Raw row tuples of a read-only worksheet"""
+    # The stored <dimension> can be stale and would truncate rows/columns;
+    # pandas reset it too before reading
+    ws.reset_dimensions()
+    return ws.iter_rows(values_only=True)
+
+def next_non_blank_row(rows):
+    """Return the next row that has at least one filled cell, or None"""
+    for values in rows:
+        if any(v is not None for v in values):
+            return values
+    return None
+
+# column_names() and row_to_dict() are duplicated in ../generate_files_xlsx.py
+# (both scripts run standalone): change the two copies together
+def column_names(headers):
+    """Header cells → unique column names, the way pandas named them"""
+    # Blank headers become "Unnamed: <i>"; repeats get ".1", ".2", ... with
+    # named columns numbered before unnamed ones (pandas' python parser)
+    names = [h if h is not None else f"Unnamed: {i}" for i, h in enumerate(headers)]
+    order = ([i for i, h in enumerate(headers) if h is not None]
+             + [i for i, h in enumerate(headers) if h is None])
+    counts = {}
+    for i in order:
+        col = base = names[i]
+        count = counts.get(col, 0)
+        while count:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in names else counts.get(col, 0)
+        names[i] = col
+        counts[col] = count + 1
+    return names
+
+def row_to_dict(header, values):
+    """Zip one raw row with the header row, padding whichever is shorter"""
+    # Cells past the header's width get pandas' "Unnamed: <i>" names
+    width = max(len(header), len(values))
+    header = list(header) + [None] * (width - len(header))
+    values = list(values) + [None] * (width - len(values))
+    return dict(zip(column_names(header), values))
+
+def parse_rows_to_dict(rows):
+    """Map the header row onto the first data row of a sheet's raw rows"""
+    # Unlike the old pandas reader, blank rows before the header and before
+    # the first data row are skipped: pandas used a blank first row as the
+    # header (all "Unnamed: <i>") and a blank first data row as an all-null
+    # record. Columns only later rows fill are also not added as null keys,
+    # since only these two rows are read
+    headers = next_non_blank_row(rows)
+    values = next_non_blank_row(rows) if headers is not None else None
+    if values is None:
+        return {}
+
+    # Values keep the type Excel stored (unlike pandas, no numeric/NA
+    # inference), so digits typed as text such as a zip code stay strings
+    values = [None if v in EXCEL_ERRORS else v for v in values]
+    return row_to_dict(headers, values)
+
+def process_sheet_to_file(spec, row_dict):
+    """Save one sheet's first row as main-data.json/.yaml in mapped folder"""
+    print(f"\n--- PROCESSING: {spec.name} ---")
+    if not row_dict:
+        print(f"⚠️ Sheet '{spec.name}' is empty — skipping")
+        return False
+
+    # Deep sanitize and create the folder once, shared by both formats
+    clean_data = {k: sanitize_value(v) for k, v in row_dict.items()}
+    os.makedirs(spec.out_dir, exist_ok=True)
 
     # Save both formats
-    save_json(row_dict, base_path + ".json")
-    save_yaml(row_dict, base_path + ".yaml")
+    save_json(clean_data, spec.base_path + ".json")
+    save_yaml(clean_data, spec.base_path + ".yaml")
+    return True
 
 def generate_all_files(input_file):
     ensure_output_dir()
     print(f"📄 Processing: {input_file}")
     
-    # Load all sheets from XLSX
-    xls = pd.read_excel(input_file, sheet_name=None)  # Returns dict: sheet_name → DataFrame
-    print(f"📄 Sheets found: {list(xls.keys())}")
-
-    for sheet_name, df_sheet in xls.items():
-        print(f"\n--- PROCESSING: {sheet_name} ---")
-        process_sheet_to_file(sheet_name, df_sheet)
+    # Stream sheets in read-only mode; only the header + first row are read
+    wb = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        print(f"📄 Sheets found: {wb.sheetnames}")
+
+        # Worksheets only: chartsheets in sheetnames have no rows to read
+        # Sequential on purpose: one row per sheet costs less than a process
+        # pool's startup, and tabs mapping to the same folder stay last-wins
+        saved = 0
+        for ws in wb.worksheets:
+            row_dict = parse_rows_to_dict(sheet_rows(ws))
+            saved += process_sheet_to_file(get_sheet_spec(ws.title), row_dict)
+        print(f"\n📦 Saved {saved} of {len(wb.worksheets)} sheets")
+    finally:
+        wb.close()
 
 def main():
     parser = argparse.ArgumentParser(description="Generate schema files from XLSX tabs")
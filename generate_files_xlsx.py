@@ -1,9 +1,12 @@
 import os
+import stat
 import json
 import yaml
-import pandas as pd
+import openpyxl
+from openpyxl.cell.cell import ERROR_CODES
 import datetime
 import xml.etree.ElementTree as ET
+from pathlib import Path
 
 # ========= CONFIG =========
 DATA_FILE = "templates/client-data.xlsx"
@@ -15,8 +18,66 @@ SITEMAP_FILE = "ai-sitemap.xml"
 def ensure_output_dir():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def load_client_data(file_path):
-    return pd.read_excel(file_path)
+# Cached formula errors ("#N/A", "#DIV/0!", ...) come back as plain strings;
+# pandas read them as NaN, so they are dropped like blank cells
+EXCEL_ERRORS = frozenset(ERROR_CODES)
+
+def blank_to_none(val):
+    if isinstance(val, str) and (not val.strip() or val in EXCEL_ERRORS):
+        return None
+    return val
+
+# column_names() and row_to_dict() are duplicated in
+# ai-generators/generate_files_from_xlsx.py (both scripts run standalone):
+# change the two copies together
+def column_names(headers):
+    """Header cells → unique column names, the way pandas named them"""
+    # Blank headers become "Unnamed: <i>"; repeats get ".1", ".2", ... with
+    # named columns numbered before unnamed ones (pandas' python parser)
+    names = [h if h is not None else f"Unnamed: {i}" for i, h in enumerate(headers)]
+    order = ([i for i, h in enumerate(headers) if h is not None]
+             + [i for i, h in enumerate(headers) if h is None])
+    counts = {}
+    for i in order:
+        col = base = names[i]
+        count = counts.get(col, 0)
+        while count:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in names else counts.get(col, 0)
+        names[i] = col
+        counts[col] = count + 1
+    return names
+
+def row_to_dict(header, values):
+    """Zip one raw row with the header row, padding whichever is shorter"""
+    # Cells past the header's width get pandas' "Unnamed: <i>" names
+    width = max(len(header), len(values))
+    header = list(header) + [None] * (width - len(header))
+    values = list(values) + [None] * (width - len(values))
+    return dict(zip(column_names(header), values))
+
+def iter_client_data(file_path):
+    """Stream (index, row dict) for the first sheet's data rows, blank cells as None"""
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()  # stale <dimension>: see sheet_rows() in ai-generators
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        if all(h is None for h in header):
+            print("⚠️ Header row is blank — columns will be named 'Unnamed: <i>'")
+        # Index counts blank rows too (pandas kept them as NaN rows), so
+        # client_<index> names stay tied to the row's position in the sheet
+        for index, values in enumerate(rows):
+            if all(v is None for v in values):
+                continue  # fully blank rows were never exported
+            # Raw Excel types, no pandas inference: see parse_rows_to_dict() in ai-generators
+            yield index, {col: blank_to_none(v) for col, v in row_to_dict(header, values).items()}
+    finally:
+        wb.close()
 
 def save_json(data, path):
     if not data:
@@ -30,29 +91,23 @@ def save_yaml(data, path):
     with open(path, "w", encoding="utf-8") as f:
         yaml.dump(data, f, allow_unicode=True)
 
-def save_md(content, path):
+def save_text(content, path):
+    """Write a Markdown/LLM text file, skipping blank content"""
     if not content.strip():
         return
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-
-def save_llm(content, path):
-    if not content.strip():
-        return
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    Path(path).write_text(content, encoding="utf-8")
 
-def generate_files_from_row(row):
+def generate_files_from_row(row, index):
     """Generate JSON, YAML, MD, and LLM files for a single row in Excel"""
-    base_name = row.get("slug") or row.get("name") or f"client_{row.name}"
+    base_name = row.get("slug") or row.get("name") or f"client_{index}"
     base_path = os.path.join(OUTPUT_DIR, base_name)
-    os.makedirs(base_path, exist_ok=True)
 
-    # Filter out empty/NaN/blank values
-    row_dict = {k: v for k, v in row.to_dict().items() if pd.notna(v) and str(v).strip()}
+    # Filter out empty/blank values (already None via iter_client_data)
+    row_dict = {k: v for k, v in row.items() if v is not None}
     if not row_dict:
         # nothing useful to save for this row
         return
+    os.makedirs(base_path, exist_ok=True)
 
     # JSON
     save_json(row_dict, os.path.join(base_path, f"{base_name}.json"))
@@ -64,23 +119,26 @@ def generate_files_from_row(row):
     md_content = f"# {row.get('name', base_name)}\n\n"
     for col, val in row_dict.items():
         md_content += f"**{col}:** {val}\n\n"
-    save_md(md_content, os.path.join(base_path, f"{base_name}.md"))
+    save_text(md_content, os.path.join(base_path, f"{base_name}.md"))
 
     # LLM text file
     llm_content = f"LLM Data for {row.get('name', base_name)}\n\n"
     for col, val in row_dict.items():
         llm_content += f"{col}: {val}\n"
-    save_llm(llm_content, os.path.join(base_path, f"{base_name}.llm"))
+    save_text(llm_content, os.path.join(base_path, f"{base_name}.llm"))
 
 def generate_all_files():
     ensure_output_dir()
-    df = load_client_data(DATA_FILE)
-    for _, row in df.iterrows():
-        generate_files_from_row(row)
+    # One row in memory at a time instead of the whole sheet as a DataFrame
+    for index, row in iter_client_data(DATA_FILE):
+        generate_files_from_row(row, index)
 
 def generate_sitemap(root_dir=OUTPUT_DIR, output_file=SITEMAP_FILE):
     """Scan generated files and build sitemap including only non-empty files"""
     urlset = ET.Element("urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+    lastmod = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    # os.walk paths all start with root_dir + separator: slice instead of relpath()
+    prefix_len = len(os.path.join(root_dir, ""))
 
     for dirpath, _, filenames in os.walk(root_dir):
         for fname in filenames:
@@ -88,15 +146,19 @@ def generate_sitemap(root_dir=OUTPUT_DIR, output_file=SITEMAP_FILE):
                 continue
 
             path = os.path.join(dirpath, fname)
-            if not os.path.isfile(path) or os.path.getsize(path) == 0:
+            # One stat for both the regular-file and non-empty checks
+            try:
+                st = os.stat(path)
+            except OSError:  # e.g. dangling symlink
+                continue
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
                 continue
 
-            rel_path = os.path.relpath(path, root_dir).replace("\\", "/")
-            url = f"{SITE_BASE}/{rel_path}"
+            rel_path = path[prefix_len:].replace("\\", "/")
 
             url_el = ET.SubElement(urlset, "url")
-            ET.SubElement(url_el, "loc").text = url
-            ET.SubElement(url_el, "lastmod").text = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+            ET.SubElement(url_el, "loc").text = f"{SITE_BASE}/{rel_path}"
+            ET.SubElement(url_el, "lastmod").text = lastmod
 
     tree = ET.ElementTree(urlset)
     tree.write(output_file, encoding="utf-8", xml_declaration=True)
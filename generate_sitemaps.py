@@ -3,44 +3,54 @@
 import os
 from pathlib import Path
 from datetime import datetime
-import glob
+from xml.sax.saxutils import escape
+
+SITEMAP_EXTENSIONS = (".json", ".yaml", ".yml", ".md", ".llm")
 
 def get_site_url():
     # Serve files via GitHub Raw — publicly crawlable by search engines & AI bots
     return "https://raw.githubusercontent.com/DFYRANKINGS/Linework-Development-AI-Data/main"
 
+def _walk(root, ancestors=frozenset()):
+    """Yield matching file paths under root in a single scandir pass"""
+    # Symlinked dirs are followed, but not into one of their own parents
+    real = os.path.realpath(root)
+    if real in ancestors:
+        return
+    ancestors = ancestors | {real}
+    try:
+        entries = os.scandir(root)
+    except OSError:  # unreadable dir: skipped silently, as glob("**") did
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith("."):  # glob("**") skipped hidden entries
+                continue
+            if entry.is_dir():  # follows symlinked dirs, as glob("**") did
+                yield from _walk(entry.path, ancestors)
+            elif entry.name.endswith(SITEMAP_EXTENSIONS):
+                yield entry.path
+
 def find_generated_files():
     """Find all generated .json, .yaml, .md, .llm in schema-files/"""
-    patterns = [
-        "schema-files/**/*.json",
-        "schema-files/**/*.yaml",
-        "schema-files/**/*.yml",
-        "schema-files/**/*.md",
-        "schema-files/**/*.llm"
-    ]
-    files = []
-    for pattern in patterns:
-        files.extend(glob.glob(pattern, recursive=True))
-    return sorted(set(files))  # dedupe
+    if not os.path.isdir("schema-files"):
+        return []
+    return sorted(_walk("schema-files"))
 
-def generate_sitemap_xml(site_url, files):
+def write_sitemap(f, site_url, files):
+    """Write the sitemap XML to an open text file, one <url> block at a time"""
     now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S+00:00")
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
 
     for file_path in files:
         public_path = file_path.replace("\\", "/")  # Windows-safe
-        full_url = f"{site_url}/{public_path}"
-        
-        xml_lines.append("  <url>")
-        xml_lines.append(f"    <loc>{full_url}</loc>")
-        xml_lines.append(f"    <lastmod>{now}</lastmod>")
-        xml_lines.append("  </url>")
+        f.write(f"  <url>\n"
+                f"    <loc>{escape(f'{site_url}/{public_path}')}</loc>\n"
+                f"    <lastmod>{now}</lastmod>\n"
+                f"  </url>\n")
 
-    xml_lines.append("</urlset>")
-    return "\n".join(xml_lines)
+    f.write("</urlset>")
 
 def main():
     site_url = get_site_url()
@@ -52,10 +62,8 @@ def main():
     for f in files:
         print(f"   - {f}")
 
-    sitemap_content = generate_sitemap_xml(site_url, files)
-
-    with open("ai-sitemap.xml", "w", encoding="utf-8") as f:
-        f.write(sitemap_content)
+    with open("ai-sitemap.xml", "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_sitemap(f, site_url, files)
 
     print("✅ ai-sitemap.xml generated successfully.")
     print("🌐 Test a file: https://raw.githubusercontent.com/DFYRANKINGS/Linework-Development-AI-Data/main/schema-files/organization/main-data.json")